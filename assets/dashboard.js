@@ -0,0 +1,63 @@
+// Clientside callbacks of the Medical Appointments Dashboard.
+// Dash loads every .js file in the assets folder automatically.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dashboard: {
+        // Filter the pre-aggregated count cube (sent once in the 'cube' dcc.Store) by the selected neighborhood
+        // and age range, and return the 5 count charts with only their data arrays replaced.
+        filterAndPlot: function (selectedNeighborhood, ageRange, cube, pieFig, ageGenderFig, weekdayFig, nbFig, chronicFig) {
+            const columns = cube.columns;
+            const labels = cube.labels;
+            const nbCode = selectedNeighborhood ? labels['Neighbourhood'].indexOf(selectedNeighborhood) : -1;
+
+            // Apply Filters: indices of the cube rows inside the age range (and in the selected neighborhood, if any)
+            const rows = [];
+            for (let i = 0; i < columns['n'].length; i++) {
+                const age = columns['Age'][i];
+                if (age >= ageRange[0] && age <= ageRange[1] && (nbCode < 0 || columns['Neighbourhood'][i] === nbCode)) {
+                    rows.push(i);
+                }
+            }
+
+            // Count table of one cube column against another: table[rowCode][colCode] = number of appointments
+            function countTable(rowColumn, colColumn) {
+                const table = labels[rowColumn].map(() => new Array(labels[colColumn].length).fill(0));
+                for (const i of rows) {
+                    table[columns[rowColumn][i]][columns[colColumn][i]] += columns['n'][i];
+                }
+                return table;
+            }
+
+            // Copy of a figure where trace j gets the row labels as x and column j of the table as y
+            function withTable(figure, rowLabels, table) {
+                const data = figure.data.map((trace, j) => Object.assign({}, trace, {
+                    x: rowLabels,
+                    y: table.map(row => row[j])
+                }));
+                return Object.assign({}, figure, {data: data});
+            }
+
+            // Pie Chart: total Show / No-show counts
+            const chronic = countTable('ChronicCondition', 'No-show');
+            const pieValues = labels['No-show'].map((_, j) => chronic.reduce((total, row) => total + row[j], 0));
+            const pie = Object.assign({}, pieFig, {data: [Object.assign({}, pieFig.data[0], {values: pieValues})]});
+
+            // Neighborhood Patterns: global Top 20 ranking, or just the selected neighborhood
+            const nbTable = countTable('Neighbourhood', 'No-show');
+            const topNb = selectedNeighborhood ? [selectedNeighborhood] : cube.top_nb;
+            const nbRows = topNb.map(name => nbTable[labels['Neighbourhood'].indexOf(name)]);
+
+            // Age & Gender Impact: only the ages inside the selected range (an age is also its row number in the table),
+            // because Plotly's autobinning spans every x value, even zero-weight ones
+            const ageRows = countTable('Age', 'Gender').slice(ageRange[0], ageRange[1] + 1);
+            const ageLabels = labels['Age'].slice(ageRange[0], ageRange[1] + 1);
+
+            return [
+                pie,
+                withTable(ageGenderFig, ageLabels, ageRows),
+                withTable(weekdayFig, labels['AppointmentWeekday'], countTable('AppointmentWeekday', 'No-show')),
+                withTable(nbFig, topNb, nbRows),
+                withTable(chronicFig, labels['ChronicCondition'], chronic)
+            ];
+        }
+    }
+});
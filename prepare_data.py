@@ -0,0 +1,120 @@
+# One-shot conversion script: raw Kaggle CSV -> cleaned Parquet file.
+# Run it once (python prepare_data.py) and the dashboard (project.py) will load
+# the cleaned Parquet file directly, so the Dash process never pays the CSV parse
+# and cleaning cost again.
+# pyarrow is required: it writes/reads the Parquet file, parses the CSV (vectorized C++ parsing)
+# and backs the text columns while they are cleaned (vectorized C++ string kernels).
+import os
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+RAW_DATA_PATH = "E:\Dashboard\KaggleV2-May-2016.csv"
+CLEANED_DATA_PATH = "E:/Dashboard/cleaned_data.parquet"
+
+# Columns read from the raw CSV: every column except the PatientId / AppointmentID identifiers, which are never used.
+RAW_COLUMNS = ['Gender', 'ScheduledDay', 'AppointmentDay', 'Age', 'Neighbourhood', 'Scholarship',
+               'Hipertension', 'Diabetes', 'Alcoholism', 'Handcap', 'SMS_received', 'No-show']
+
+# ScheduledDay / AppointmentDay are ISO timestamps like 2016-04-29T18:38:08Z.
+# Giving the format explicitly avoids per-value format inference when pandas parses them.
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+# Version of the cleaned data layout (columns and their types), stored in the Parquet file's metadata.
+# Bump it whenever a change to the cleaning code below changes what is stored, so that a file written by an older
+# version is rebuilt instead of being loaded.
+CLEANED_DATA_VERSION = b"1"
+CLEANED_DATA_VERSION_KEY = b"cleaned_data_version"
+
+
+# The cleaned Parquet file can be used only if it exists and was written with the current CLEANED_DATA_VERSION.
+def cleaned_data_is_current():
+    if not os.path.exists(CLEANED_DATA_PATH):
+        return False
+    metadata = pq.read_schema(CLEANED_DATA_PATH).metadata or {}
+    return metadata.get(CLEANED_DATA_VERSION_KEY) == CLEANED_DATA_VERSION
+
+
+def build_cleaned_data():
+    # Reading the dataset from the local directory (previously downloaded from Kaggle)
+    # and loading it into a pandas DataFrame.
+    # The two date columns are parsed to datetime directly by the reader, so no separate conversion pass is needed.
+    # Only the columns listed in RAW_COLUMNS are parsed.
+    df = pd.read_csv(RAW_DATA_PATH, usecols=RAW_COLUMNS, engine="pyarrow",
+                     parse_dates=['ScheduledDay', 'AppointmentDay'], date_format=DATE_FORMAT)
+    print(df)
+    print("*"*20)
+    # Exploratory Data Analysis (EDA) /Data Overview
+    print(df.head()) # => Display the first 5 rows
+    print("*"*20)
+    print(df.info()) # => Column information and data types
+    print("*"*20)
+    print(df.isnull().sum()) # => Missing values
+    print("*"*20)
+    print(df.describe()) # => Statistical description of numeric columns
+
+    # Important notes from the EDA:
+    # No missing values → Good for cleaning.
+    # Irrelevant ages (negative values) should be removed.
+    # Booking dates and appointments are present and already parsed to datetime by read_csv.
+    # The absence rate (No-show) must be analyzed.
+    # We need to add additional columns for analysis:
+    # The difference in days between booking and appointment (DaysDiff).
+    # The day of the week for the appointment (AppointmentWeekday).
+
+
+    # Data Cleaning
+    df = df[df['Age'] >= 0] # => Remove any row with an Age less than 0 because it doesn't make sense.
+
+    # => Calculate the difference between the appointment date and the booking date (in days) and add it as a new column, DaysDiff. This is important to understand the waiting time and its impact on absences.
+    # Done directly on the int64 nanosecond timestamps (one subtraction + one floor division, same result as .dt.days)
+    # instead of building an intermediate Timedelta column. DaysDiff is at most a few hundred days, so it fits in int16.
+    df['DaysDiff'] = ((df['AppointmentDay'].to_numpy(dtype='datetime64[ns]').view('i8')
+                       - df['ScheduledDay'].to_numpy(dtype='datetime64[ns]').view('i8')) // 86_400_000_000_000).astype('int16')
+
+    df = df[df['DaysDiff'] >= 0] # => Remove any row where the difference between the reservation and the appointment is negative, as this is a data error.
+
+
+    # Remove any extra spaces from the text values in the three columns (Gender, Neighborhood, No-show) to ensure clean data when analyzed.
+    # With Arrow-backed strings, .str.strip() runs as one vectorized Arrow compute kernel instead of a Python-level loop.
+    for c in ['Gender', 'Neighbourhood', 'No-show']:
+        df[c] = df[c].astype('string[pyarrow]').str.strip()
+
+    df['No_show_flag'] = (df['No-show'] == 'Yes').astype('int8') # => Convert the No-show column from text to a number (0, attended) or (1, not attended) for easier analysis, with one vectorized comparison.
+
+    df['AppointmentWeekday'] = df['AppointmentDay'].dt.dayofweek.astype('int8') # => Add a new column named AppointmentWeekday containing the day of the week (0 = Monday ... 6 = Sunday) to specify the distribution of appointments by day. Small integers sort in calendar order and are cheaper to group than day-name strings.
+
+    # Add a ChronicCondition column: 'Yes' if the patient has at least one chronic condition (Hipertension, Diabetes, Alcoholism), otherwise 'No'.
+    # Computed once here (vectorized with NumPy) so the dashboard does not recompute it on every callback.
+    df['ChronicCondition'] = np.where(df[['Hipertension', 'Diabetes', 'Alcoholism']].to_numpy().sum(axis=1) > 0, 'Yes', 'No')
+
+    # Convert the low-cardinality text columns to the pandas 'category' dtype: each value is stored once and rows hold small integer codes,
+    # so the data takes less memory and filters / groupby / value_counts work on the integer codes instead of Python strings.
+    for c in ['Gender', 'Neighbourhood', 'No-show', 'ChronicCondition']:
+        df[c] = df[c].astype('category')
+
+    # Downcast the numeric columns to the narrowest integer types that fit their values (pandas defaults to int64):
+    # Age (0..115) and the small flag columns (0/1, Handcap 0..4) fit in int8 (DaysDiff and No_show_flag are already int16 / int8).
+    for c in ['Age', 'Scholarship', 'Hipertension', 'Diabetes', 'Alcoholism', 'Handcap', 'SMS_received']:
+        df[c] = df[c].astype('int8')
+
+
+    # Save the cleaned and optimized data in a new Parquet file named cleaned_data.parquet in the specified path.
+    # Parquet is columnar and compressed (snappy), so it is smaller on disk and much faster to read back than CSV,
+    # and the dashboard can load only the columns it actually plots.
+    # preserve_index=False means that row numbers (Index) are not saved in the file.
+    # CLEANED_DATA_VERSION is added to the file's metadata (next to the pandas metadata that restores the column types).
+    # Display the first 10 rows to confirm.
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**table.schema.metadata, CLEANED_DATA_VERSION_KEY: CLEANED_DATA_VERSION})
+    pq.write_table(table, CLEANED_DATA_PATH, compression="snappy")
+    print(df.head(10))
+
+    return df
+
+
+# Run the conversion only if this script is executed directly
+if __name__ == '__main__':
+    build_cleaned_data()
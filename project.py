@@ -1,235 +1,332 @@
-# # Importing the required libraries for the task:
-# pandas for data manipulation, dash for building the interactive dashboard,
-# and plotly.express for creating visualizations.
-import pandas as pd
-import dash
-from dash import dcc, html, Input, Output
-import plotly.express as px
-
-# Reading the dataset from the local directory (previously downloaded from Kaggle)
-# and loading it into a pandas DataFrame.
-df = pd.read_csv("E:\Dashboard\KaggleV2-May-2016.csv")
-print(df)
-print("*"*20)
-# Exploratory Data Analysis (EDA) /Data Overview
-print(df.head()) # => Display the first 5 rows
-print("*"*20)
-print(df.info()) # => Column information and data types
-print("*"*20)
-print(df.isnull().sum()) # => Missing values
-print("*"*20)
-print(df.describe()) # => Statistical description of numeric columns
-
-# Important notes from the EDA:
-# No missing values → Good for cleaning.
-# Irrelevant ages (negative values) should be removed. 
-# Booking dates and appointments are present but must be converted to datetime.
-# The absence rate (No-show) must be analyzed.
-# We need to add additional columns for analysis:
-# The difference in days between booking and appointment (DaysDiff).
-# The day of the week for the appointment (AppointmentWeekday).
-
-
-# Data Cleaning
-df = df[df['Age'] >= 0] # => Remove any row with an Age less than 0 because it doesn't make sense.
-
-df['ScheduledDay'] = pd.to_datetime(df['ScheduledDay'])  # => Convert the ScheduledDay column from a string to a datetime format so we can perform calculations on it.
-
-df['AppointmentDay'] = pd.to_datetime(df['AppointmentDay']) # => Convert the AppointmentDay column to datetime format so we can perform calculations on it.
-
-df['DaysDiff'] = (df['AppointmentDay'] - df['ScheduledDay']).dt.days # => Calculate the difference between the appointment date and the booking date (in days) and add it as a new column, DaysDiff. This is important to understand the waiting time and its impact on absences.
-
-df = df[df['DaysDiff'] >= 0] # => Remove any row where the difference between the reservation and the appointment is negative, as this is a data error.
-
-
-# Remove any extra spaces from the text values in the three columns (Gender, Neighborhood, No-show) to ensure clean data when analyzed.
-df['Gender'] = df['Gender'].str.strip()
-df['Neighbourhood'] = df['Neighbourhood'].str.strip()
-df['No-show'] = df['No-show'].str.strip()
-
-df['No_show_flag'] = df['No-show'].map({'No': 0, 'Yes': 1}) # => Convert the No-show column from text to a number (0, attended) or (1, not attended) for easier analysis.
-
-df['AppointmentWeekday'] = df['AppointmentDay'].dt.day_name() # => Add a new column named AppointmentWeekday containing the name of the day of the week to specify the distribution of appointments by day.
-
-
-# Save the cleaned and optimized data in a new CSV file named cleaned_data.csv in the specified path.
-# Index=False means that row numbers (Index) are not saved in the file.
-# Display the first 10 rows to confirm.
-df.to_csv("E:/Dashboard/cleaned_data.csv", index=False)
-print(df.head(10))
-
-
-# Initialize the Dash application and set the dashboard title
-app = dash.Dash(__name__)
-app.title = "📊 Medical Appointments Dashboard"
-
-# Define the layout of the dashboard using Dash HTML components
-app.layout = html.Div([
-    html.H1("📊 Medical Appointments Dashboard", style={   # => Main Title of the Dashboard with custom styling
-        'textAlign': 'center',  # => Center align the text
-        'color': "#921097",   # => Title color (purple)
-        'fontSize': '36px',       # =>  Large font size
-        'fontWeight': 'bold',  # =>  Bold font
-        'fontFamily': 'Poppins, Arial, sans-serif'  # => Font style
-    }),
-
-   # Filters Section (Inside a styled Box
-    html.Div([
-        # Dropdown for selecting Neighborhood
-        html.Div([
-            html.Label("Select Neighborhood:", style={'font-weight': 'bold', 'color': '#083663'}), # => Dynamic options from data.
-            dcc.Dropdown(
-                id='neighborhood-dropdown',
-                options=[{'label': nb, 'value': nb} for nb in sorted(df['Neighbourhood'].unique())],
-                value=None, # => Default value (None = All neighborhoods)
-                placeholder="All Neighborhoods"
-            ),
-        ], style={'width': '30%', 'display': 'inline-block', 'margin-right': '20px'}),
-
-        # Range Slider for selecting Age range
-        html.Div([
-            html.Label("Select Age Range:", style={'font-weight': 'bold', 'color': '#083663'}),
-            dcc.RangeSlider(
-                id='age-slider',
-                min=0,
-                max=100,
-                step=1,
-                value=[0, 100],
-                marks={i: str(i) for i in range(0, 101, 10)} # => Show labels every 10 year
-            ),
-        ], style={'width': '65%', 'display': 'inline-block'}),
-    ], style={
-        'backgroundColor': "#F8F9FA",
-        'padding': '15px',
-        'borderRadius': '10px',
-        'boxShadow': '2px 2px 10px lightgrey',
-        'marginBottom': '20px'
-    }),
-
-    # Visualization - Graphs inside Styled Boxes
-    # Each chart is placed inside a separate HTML Div with custom styling:
-    # Light background
-    # Padding for inner spacing
-    # Rounded corners for modern design
-    # Box shadow for a card-like effect
-    # Margin bottom for spacing between charts
-
-    # Pie Chart: Shows vs No-shows
-    html.Div([
-        dcc.Graph(id='pie-show-noshows', style={'height': '450px'})
-    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
-    
-    # Histogram: Age and Gender Impact on Attendance
-    html.Div([
-        dcc.Graph(id='age-gender-impact', style={'height': '450px'})
-    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
-
-    # Histogram: Appointment Distribution by Weekday
-    html.Div([
-        dcc.Graph(id='weekday-distribution', style={'height': '450px'})
-    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
- 
-    # Histogram: Attendance Patterns by Top Neighborhoods
-    html.Div([
-        dcc.Graph(id='neighborhood-patterns', style={'height': '600px'})
-    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
-
-    # Histogram: Impact of Chronic Conditions on Attendance
-    html.Div([
-        dcc.Graph(id='chronic-conditions-impact', style={'height': '450px'})
-    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
-
-    # Box Plot: Delay between Scheduling and Appointment vs Attendance
-    html.Div([
-        dcc.Graph(id='delay-impact', style={'height': '450px'})
-    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
-
-    html.Hr(),
-    html.Div("Dashboard created with Dash & Plotly | Dataset: Medical Appointment No-Show",
-             style={'textAlign': 'center', 'color': '#7F8C8D', 'fontSize': '14px'})
-
-    # Set the overall page background and padding
-], style={'backgroundColor': "#6EDBC39B", 'padding': '20px'})
-
-
-
-# Callbacks - Dynamic Update of Charts based on Filters
-# Define callback to update all 6 graphs when user changes:
-# - Neighborhood selection (Dropdown)
-# - Age range selection (RangeSlider)
-
-@app.callback(
-    Output('pie-show-noshows', 'figure'),
-    Output('age-gender-impact', 'figure'),
-    Output('weekday-distribution', 'figure'),
-    Output('neighborhood-patterns', 'figure'),
-    Output('chronic-conditions-impact', 'figure'),
-    Output('delay-impact', 'figure'),
-    Input('neighborhood-dropdown', 'value'),
-    Input('age-slider', 'value')
-)
-# Make a copy of the main dataframe
-def update_charts(selected_neighborhood, age_range):
-    dff = df.copy()
-
-    # Apply Filters
-    # Filter by neighborhood if user selected a specific one
-    if selected_neighborhood:
-        dff = dff[dff['Neighbourhood'] == selected_neighborhood]
-
-    # Filter by selected age range from RangeSlider
-    dff = dff[(dff['Age'] >= age_range[0]) & (dff['Age'] <= age_range[1])]
-
-    # Pie Chart: Show vs No-show
-    pie_fig = px.pie(
-        dff, names='No-show', title='Show vs No-show Rate', color='No-show',
-        color_discrete_map={'No': '#2ECC71', 'Yes': '#E74C3C'}
-    )
-
-    # Age & Gender Impact
-    age_gender_fig = px.histogram(
-        dff, x='Age', color='Gender', barmode='overlay', nbins=40,
-        title='Age and Gender Impact on Attendance',
-        color_discrete_sequence=["#AD749F", "#271588"]
-    )
-
-    # Appointments by Day of the Week
-    weekday_fig = px.histogram(
-        dff, x='AppointmentWeekday', color='No-show', barmode='group',
-        category_orders={'AppointmentWeekday': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']},
-        title='Appointments by Weekday',
-        color_discrete_map={'No': "#CFC141", 'Yes': "#642901"}
-    )
-
-    # Neighborhood Patterns (Top 20)
-    top_nb = dff['Neighbourhood'].value_counts().head(20).index
-    nb_fig = px.histogram(
-        dff[dff['Neighbourhood'].isin(top_nb)], x='Neighbourhood', color='No-show', barmode='group',
-        title='Attendance Patterns (Top 20 Neighborhoods)',
-        color_discrete_map={'No': "#CC602E", 'Yes': "#C04343"}
-    )
-    nb_fig.update_xaxes(tickangle=45)
-
-    # Chronic Conditions Impact
-    dff['HasChronic'] = dff[['Hipertension', 'Diabetes', 'Alcoholism']].sum(axis=1)
-    dff['ChronicCondition'] = dff['HasChronic'].apply(lambda x: 'Yes' if x > 0 else 'No')
-    chronic_fig = px.histogram(
-        dff, x='ChronicCondition', color='No-show', barmode='group',
-        title='Impact of Chronic Conditions',
-        color_discrete_map={'No': "#2B4B0D", 'Yes': "#0F3147"}
-    )
-
-    # Delay Between Scheduling and Appointment
-    delay_fig = px.box(
-        dff, x='No-show', y='DaysDiff',
-        title='Delay Between Scheduling and Appointment vs Attendance',
-        color='No-show',
-        color_discrete_map={'No': "#0C524C", 'Yes': '#660925'}
-    )
-
-    # Return all figures to be displayed in dashboard
-    return pie_fig, age_gender_fig, weekday_fig, nb_fig, chronic_fig, delay_fig
-
-# Run the Dash app only if this script is executed directly 
-if __name__ == '__main__':
+# # Importing the required libraries for the task:
+# pandas for data manipulation, dash for building the interactive dashboard,
+# and plotly.express for creating visualizations.
+import os
+import numpy as np
+import pandas as pd
+import dash
+from dash import dcc, html, Input, Output, State, Patch, ClientsideFunction
+from flask_caching import Cache
+import plotly.express as px
+import plotly.graph_objects as go
+
+from prepare_data import CLEANED_DATA_PATH, RAW_DATA_PATH, build_cleaned_data, cleaned_data_is_current
+
+# Columns actually used by the charts and filters below.
+# Parquet is columnar, so only these columns are read from disk.
+CHART_COLUMNS = ['Neighbourhood', 'Age', 'Gender', 'No-show', 'AppointmentWeekday',
+                 'ChronicCondition', 'DaysDiff']
+
+# Load the cleaned data produced by prepare_data.py.
+# On the first run (no Parquet file yet), or when the Parquet file was written by an older version of prepare_data.py,
+# fall back to reading the raw CSV and cleaning it, which also (re)writes the Parquet file so the next launch skips the CSV entirely.
+if cleaned_data_is_current():
+    df = pd.read_parquet(CLEANED_DATA_PATH, columns=CHART_COLUMNS)
+elif os.path.exists(RAW_DATA_PATH):
+    df = build_cleaned_data()[CHART_COLUMNS]
+else:
+    raise FileNotFoundError(
+        f"{CLEANED_DATA_PATH} is missing or was written by an older version of prepare_data.py, "
+        f"and the raw dataset {RAW_DATA_PATH} needed to rebuild it was not found."
+    )
+
+# Pre-aggregated count cube: one row per unique combination of the categorical dimensions
+# used by the count-based charts, with the number of appointments in column 'n'.
+# The callback filters this (much smaller) cube instead of re-scanning every appointment row.
+CUBE_COLUMNS = ['Neighbourhood', 'Age', 'Gender', 'No-show', 'AppointmentWeekday', 'ChronicCondition']
+cube = df.groupby(CUBE_COLUMNS, observed=True).size().reset_index(name='n')
+
+# Day names for the AppointmentWeekday day numbers (0 = Monday ... 6 = Sunday).
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Every age from 0 to the oldest patient (Age values are used directly as row numbers in the count tables).
+AGES = list(range(int(df['Age'].max()) + 1))
+
+# Default selection of the age RangeSlider.
+DEFAULT_AGE_RANGE = [0, 100]
+
+# Top 20 neighborhoods by number of appointments, ranked once over the whole dataset.
+TOP_NB = df['Neighbourhood'].value_counts().head(20).index.to_list()
+
+# Cube columns extracted once as plain NumPy arrays (one array per column), sent to the browser as the 'cube' store.
+# Categorical columns are stored as their integer category codes; Age and AppointmentWeekday are already small integers.
+CATEGORY_COLUMNS = ['Neighbourhood', 'Gender', 'No-show', 'ChronicCondition']
+CUBE_ARRAYS = {c: cube[c].to_numpy() for c in ['Age', 'AppointmentWeekday', 'n']}
+CUBE_ARRAYS.update({c: cube[c].cat.codes.to_numpy() for c in CATEGORY_COLUMNS})
+# Label of each code, per cube column.
+CUBE_LABELS = {'Age': AGES, 'AppointmentWeekday': WEEKDAYS}
+CUBE_LABELS.update({c: cube[c].cat.categories for c in CATEGORY_COLUMNS})
+
+# Per-appointment arrays needed by the delay box plot (its quartiles need every DaysDiff value, not just counts).
+# They are all reordered once by Age, so any age range is a contiguous slice that np.searchsorted finds in O(log n).
+AGE_ORDER = np.argsort(df['Age'].to_numpy(), kind='stable')
+AGE = df['Age'].to_numpy()[AGE_ORDER]
+NB_CODES = df['Neighbourhood'].cat.codes.to_numpy()[AGE_ORDER]
+NOSHOW_CODES = df['No-show'].cat.codes.to_numpy()[AGE_ORDER]
+DAYSDIFF = df['DaysDiff'].to_numpy()[AGE_ORDER]
+
+# df, the cube and these arrays are the single shared store for every callback: they are never modified after startup
+# (callbacks only build new masks and tables from them), and the arrays are made read-only so an accidental in-place write fails loudly.
+for values in [AGE, NB_CODES, NOSHOW_CODES, DAYSDIFF, *CUBE_ARRAYS.values()]:
+    values.flags.writeable = False
+
+
+# Box plot summary of a DaysDiff sample, computed the same way Plotly draws a box: quartiles interpolated at
+# position p * N - 0.5 (NumPy's 'hazen' method) and whiskers (fences) at the most extreme values within 1.5 IQR of the box.
+# Only these 5 numbers are sent to the browser instead of every DaysDiff value (outlier points are not drawn).
+# Values are 1-element lists (empty for an empty sample), ready to be passed to go.Box.
+def box_stats(values):
+    if len(values) == 0:
+        return {'q1': [], 'median': [], 'q3': [], 'lowerfence': [], 'upperfence': []}
+    q1, median, q3 = np.percentile(values, [25, 50, 75], method='hazen')
+    iqr = q3 - q1
+    return {
+        'q1': [float(q1)], 'median': [float(median)], 'q3': [float(q3)],
+        'lowerfence': [float(values[values >= q1 - 1.5 * iqr].min())],
+        'upperfence': [float(values[values <= q3 + 1.5 * iqr].max())],
+    }
+
+
+# Initialize the Dash application and set the dashboard title
+app = dash.Dash(__name__)
+app.title = "📊 Medical Appointments Dashboard"
+
+# In-memory (RAM) cache for the delay box plot statistics: dragging the age slider back and forth repeats the same
+# (neighborhood, age range) combinations, which are then served from the cache instead of being recomputed.
+cache = Cache(app.server, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 600})
+
+
+# Box plot summaries of DaysDiff per No-show value for one (neighborhood, age range) selection.
+# Memoized: the result for each argument combination is kept in the cache for CACHE_DEFAULT_TIMEOUT seconds.
+@cache.memoize()
+def compute_delay_stats(selected_neighborhood, age_min, age_max):
+    # Apply Filters
+    # Selected age range from RangeSlider: the arrays are sorted by Age, so the range is the slice [lo:hi] found by binary search.
+    lo, hi = np.searchsorted(AGE, [age_min, age_max + 1])
+    noshow_codes, daysdiff = NOSHOW_CODES[lo:hi], DAYSDIFF[lo:hi]
+    # Filter by neighborhood code (only inside the age slice) if user selected a specific one
+    if selected_neighborhood:
+        in_nb = NB_CODES[lo:hi] == CUBE_LABELS['Neighbourhood'].get_loc(selected_neighborhood)
+        noshow_codes, daysdiff = noshow_codes[in_nb], daysdiff[in_nb]
+    return {label: box_stats(daysdiff[noshow_codes == code]) for code, label in enumerate(CUBE_LABELS['No-show'])}
+
+
+# Table of zeros shaped like a count table (rows = row_labels, columns = the labels of col_column).
+# The count figures are built from these only to fix their traces, titles and colors:
+# the clientside callback fills in the actual counts, including on the initial page load.
+def empty_table(row_labels, row_column, col_column='No-show'):
+    return pd.DataFrame(0, index=pd.Index(row_labels, name=row_column),
+                        columns=pd.Index(CUBE_LABELS[col_column], name=col_column))
+
+
+# Build the 6 base figures (used once, for the initial page).
+# The callbacks below then only replace the data arrays of these figures (titles, colors and layout are sent once),
+# so every figure keeps one trace per column of its count table, in the same order.
+def make_figures(delay_stats):
+    # Pie Chart: Show vs No-show
+    noshow_labels = list(CUBE_LABELS['No-show'])
+    pie_fig = px.pie(
+        names=noshow_labels, values=[0] * len(noshow_labels), title='Show vs No-show Rate', color=noshow_labels,
+        color_discrete_map={'No': '#2ECC71', 'Yes': '#E74C3C'}
+    )
+
+    # Age & Gender Impact (histogram weighted by the per-age counts)
+    # Only ages inside the age range are given as x: Plotly's autobinning spans every x value, even zero-weight ones.
+    age_gender_fig = px.histogram(
+        empty_table(AGES[DEFAULT_AGE_RANGE[0]:DEFAULT_AGE_RANGE[1] + 1], 'Age', 'Gender').stack().rename('n').reset_index(), x='Age', y='n', histfunc='sum', color='Gender', barmode='overlay', nbins=40,
+        title='Age and Gender Impact on Attendance',
+        color_discrete_sequence=["#AD749F", "#271588"]
+    )
+    age_gender_fig.update_yaxes(title_text='count')
+
+    # Appointments by Day of the Week
+    # Each bar chart below is drawn from a count table (wide form: one bar trace per No-show column).
+    weekday_fig = px.bar(
+        empty_table(WEEKDAYS, 'AppointmentWeekday'), barmode='group',
+        title='Appointments by Weekday', labels={'value': 'count'},
+        color_discrete_map={'No': "#CFC141", 'Yes': "#642901"}
+    )
+
+    # Neighborhood Patterns (Top 20)
+    nb_fig = px.bar(
+        empty_table(TOP_NB, 'Neighbourhood'), barmode='group',
+        title='Attendance Patterns (Top 20 Neighborhoods)', labels={'value': 'count'},
+        color_discrete_map={'No': "#CC602E", 'Yes': "#C04343"}
+    )
+    nb_fig.update_xaxes(tickangle=45)
+
+    # Chronic Conditions Impact
+    chronic_fig = px.bar(
+        empty_table(CUBE_LABELS['ChronicCondition'], 'ChronicCondition'), barmode='group',
+        title='Impact of Chronic Conditions', labels={'value': 'count'},
+        color_discrete_map={'No': "#2B4B0D", 'Yes': "#0F3147"}
+    )
+
+    # Delay Between Scheduling and Appointment (one box per No-show value, drawn from the precomputed summary)
+    delay_colors = {'No': "#0C524C", 'Yes': '#660925'}
+    delay_fig = go.Figure([
+        go.Box(x=[label] * len(stats['median']), name=label, marker_color=delay_colors[label], **stats)
+        for label, stats in delay_stats.items()
+    ])
+    delay_fig.update_layout(
+        title='Delay Between Scheduling and Appointment vs Attendance',
+        xaxis_title='No-show', yaxis_title='DaysDiff', legend_title_text='No-show'
+    )
+
+    return pie_fig, age_gender_fig, weekday_fig, nb_fig, chronic_fig, delay_fig
+
+
+# Base figures; the delay box plot starts with the statistics for the default filters (all neighborhoods, age slider at 0-100).
+pie_fig, age_gender_fig, weekday_fig, nb_fig, chronic_fig, delay_fig = make_figures(compute_delay_stats.uncached(None, *DEFAULT_AGE_RANGE))
+
+# The count cube as sent to the browser (once, in a dcc.Store) for the clientside callback:
+# one list per cube column (integer codes), the label of each code, and the global Top 20 neighborhoods.
+CUBE_STORE = {
+    'columns': {c: values.tolist() for c, values in CUBE_ARRAYS.items()},
+    'labels': {c: list(labels) for c, labels in CUBE_LABELS.items()},
+    'top_nb': TOP_NB,
+}
+
+# Define the layout of the dashboard using Dash HTML components
+app.layout = html.Div([
+    html.H1("📊 Medical Appointments Dashboard", style={   # => Main Title of the Dashboard with custom styling
+        'textAlign': 'center',  # => Center align the text
+        'color': "#921097",   # => Title color (purple)
+        'fontSize': '36px',       # =>  Large font size
+        'fontWeight': 'bold',  # =>  Bold font
+        'fontFamily': 'Poppins, Arial, sans-serif'  # => Font style
+    }),
+
+    # Pre-aggregated count cube, kept in the browser for the clientside callback
+    dcc.Store(id='cube', data=CUBE_STORE),
+
+   # Filters Section (Inside a styled Box
+    html.Div([
+        # Dropdown for selecting Neighborhood
+        html.Div([
+            html.Label("Select Neighborhood:", style={'font-weight': 'bold', 'color': '#083663'}), # => Dynamic options from data.
+            dcc.Dropdown(
+                id='neighborhood-dropdown',
+                options=[{'label': nb, 'value': nb} for nb in sorted(df['Neighbourhood'].unique())],
+                value=None, # => Default value (None = All neighborhoods)
+                placeholder="All Neighborhoods"
+            ),
+        ], style={'width': '30%', 'display': 'inline-block', 'margin-right': '20px'}),
+
+        # Range Slider for selecting Age range
+        html.Div([
+            html.Label("Select Age Range:", style={'font-weight': 'bold', 'color': '#083663'}),
+            dcc.RangeSlider(
+                id='age-slider',
+                min=0,
+                max=100,
+                step=1,
+                value=DEFAULT_AGE_RANGE,
+                marks={i: str(i) for i in range(0, 101, 10)} # => Show labels every 10 year
+            ),
+        ], style={'width': '65%', 'display': 'inline-block'}),
+    ], style={
+        'backgroundColor': "#F8F9FA",
+        'padding': '15px',
+        'borderRadius': '10px',
+        'boxShadow': '2px 2px 10px lightgrey',
+        'marginBottom': '20px'
+    }),
+
+    # Visualization - Graphs inside Styled Boxes
+    # Each chart is placed inside a separate HTML Div with custom styling:
+    # Light background
+    # Padding for inner spacing
+    # Rounded corners for modern design
+    # Box shadow for a card-like effect
+    # Margin bottom for spacing between charts
+
+    # Pie Chart: Shows vs No-shows
+    html.Div([
+        dcc.Graph(id='pie-show-noshows', figure=pie_fig, style={'height': '450px'})
+    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
+    
+    # Histogram: Age and Gender Impact on Attendance
+    html.Div([
+        dcc.Graph(id='age-gender-impact', figure=age_gender_fig, style={'height': '450px'})
+    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
+
+    # Histogram: Appointment Distribution by Weekday
+    html.Div([
+        dcc.Graph(id='weekday-distribution', figure=weekday_fig, style={'height': '450px'})
+    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
+ 
+    # Histogram: Attendance Patterns by Top Neighborhoods
+    html.Div([
+        dcc.Graph(id='neighborhood-patterns', figure=nb_fig, style={'height': '600px'})
+    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
+
+    # Histogram: Impact of Chronic Conditions on Attendance
+    html.Div([
+        dcc.Graph(id='chronic-conditions-impact', figure=chronic_fig, style={'height': '450px'})
+    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
+
+    # Box Plot: Delay between Scheduling and Appointment vs Attendance
+    html.Div([
+        dcc.Graph(id='delay-impact', figure=delay_fig, style={'height': '450px'})
+    ], style={'backgroundColor': '#F8F9FA', 'padding': '10px', 'borderRadius': '10px', 'boxShadow': '2px 2px 10px lightgrey', 'marginBottom': '20px'}),
+
+    html.Hr(),
+    html.Div("Dashboard created with Dash & Plotly | Dataset: Medical Appointment No-Show",
+             style={'textAlign': 'center', 'color': '#7F8C8D', 'fontSize': '14px'})
+
+    # Set the overall page background and padding
+], style={'backgroundColor': "#6EDBC39B", 'padding': '20px'})
+
+
+
+# Callbacks - Dynamic Update of Charts based on Filters
+# Define callbacks to update all 6 graphs when user changes:
+# - Neighborhood selection (Dropdown)
+# - Age range selection (RangeSlider)
+
+# The 5 count charts are filled entirely in the browser: the JavaScript function filterAndPlot (assets/dashboard.js)
+# sums the rows of the 'cube' store matching the filters and replaces the data arrays of the current figures,
+# so moving the filters needs no round trip to the server for these charts.
+# It also runs on the initial page load, to fill the empty base figures for the default filters.
+app.clientside_callback(
+    ClientsideFunction(namespace='dashboard', function_name='filterAndPlot'),
+    Output('pie-show-noshows', 'figure'),
+    Output('age-gender-impact', 'figure'),
+    Output('weekday-distribution', 'figure'),
+    Output('neighborhood-patterns', 'figure'),
+    Output('chronic-conditions-impact', 'figure'),
+    Input('neighborhood-dropdown', 'value'),
+    Input('age-slider', 'value'),
+    State('cube', 'data'),
+    State('pie-show-noshows', 'figure'),
+    State('age-gender-impact', 'figure'),
+    State('weekday-distribution', 'figure'),
+    State('neighborhood-patterns', 'figure'),
+    State('chronic-conditions-impact', 'figure')
+)
+
+
+# The delay box plot needs quartiles of the individual DaysDiff values, which the count cube does not hold,
+# so it stays on the server. Its initial call is skipped because the layout already holds the statistics for the default filters.
+# It returns a Patch that only replaces the box statistics of the figure already on the page.
+@app.callback(
+    Output('delay-impact', 'figure'),
+    Input('neighborhood-dropdown', 'value'),
+    Input('age-slider', 'value'),
+    prevent_initial_call=True
+)
+def update_delay_chart(selected_neighborhood, age_range):
+    delay_stats = compute_delay_stats(selected_neighborhood, age_range[0], age_range[1])
+
+    # Delay Between Scheduling and Appointment (one box trace per No-show value)
+    delay_patch = Patch()
+    for i, (label, stats) in enumerate(delay_stats.items()):
+        delay_patch['data'][i]['x'] = [label] * len(stats['median'])
+        for key, value in stats.items():
+            delay_patch['data'][i][key] = value
+    return delay_patch
+
+# Run the Dash app only if this script is executed directly 
+if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file